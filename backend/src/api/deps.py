@@ -6,7 +6,7 @@ generic error messages to prevent timing attacks and user enumeration.
 """
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
+from sqlmodel import Session
 from uuid import UUID
 from src.models.user import User
 from src.database import get_db
@@ -69,19 +69,19 @@ async def get_current_user(
         try:
             user_id = UUID(user_id_str)
         except ValueError:
-            logger.warning(f"Invalid UUID in JWT: {user_id_str}")
+            logger.warning("Invalid UUID in JWT: %s", user_id_str)
             raise AuthError("Invalid token")
 
-        # Fetch user from database
-        user = db.exec(select(User).where(User.id == user_id)).first()
+        # Fetch user by primary key (identity map first, then a PK SELECT)
+        user = db.get(User, user_id)
 
         if not user:
-            logger.warning(f"User not found for JWT: {user_id}")
+            logger.warning("User not found for JWT: %s", user_id)
             raise AuthError("Invalid token")
 
         # Check if user account is active
         if not user.is_active:
-            logger.warning(f"Disabled user attempted access: {user_id}")
+            logger.warning("Disabled user attempted access: %s", user_id)
             raise AuthError("Account disabled")
 
         return user
@@ -96,12 +96,12 @@ async def get_current_user(
         logger.warning("JWT audience mismatch")
         raise AuthError("Invalid token")
     except jwt.InvalidTokenError as e:
-        logger.warning(f"Invalid JWT token: {e}")
+        logger.warning("Invalid JWT token: %s", e)
         raise AuthError("Invalid token")
     except AuthError:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in get_current_user: {e}")
+        logger.error("Unexpected error in get_current_user: %s", e)
         raise AuthError("Authentication failed")
 
 
@@ -1,7 +1,8 @@
 """Authentication API routes for registration, login, logout, and token management."""
 from fastapi import APIRouter, Depends, status, Response
-from sqlmodel import Session
-from src.database import get_db
+from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.database import get_async_db
 from src.schemas.auth_schemas import (
     RegisterRequest,
     LoginRequest,
@@ -17,6 +18,20 @@ from src.models.user import User
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a response model straight to JSON bytes.
+
+    The service builds these models from trusted values, so the route skips
+    FastAPI's response_model re-validation; response_model stays on the
+    decorator for the OpenAPI schema.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code
+    )
+
+
 @router.post(
     "/register",
     response_model=AuthResponse,
@@ -24,15 +39,15 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     summary="Register a new user",
     description="Create a new user account with email and password"
 )
-def register(
+async def register(
     request: RegisterRequest,
-    db: Session = Depends(get_db)
-) -> AuthResponse:
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
     """Register a new user account.
 
     **Request Body:**
     - `email`: User's email address (will be normalized to lowercase)
-    - `password`: Plain text password (min 8 chars, at least one letter and one number)
+    - `password`: Plain text password (min 8 chars, with uppercase, lowercase, digit and special character)
 
     **Success Response (201):**
     - `user`: User profile (id, email, created_at)
@@ -46,10 +61,11 @@ def register(
     - `409`: Email already registered
     """
     auth_service = AuthService(db)
-    return auth_service.register(
+    result = await auth_service.register(
         email=request.email,
         password=request.password
     )
+    return _json_response(result, status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -59,10 +75,10 @@ def register(
     summary="Authenticate user",
     description="Login with email and password to receive access and refresh tokens"
 )
-def login(
+async def login(
     request: LoginRequest,
-    db: Session = Depends(get_db)
-) -> AuthResponse:
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
     """Authenticate user and issue tokens.
 
     **Request Body:**
@@ -81,10 +97,11 @@ def login(
     - `429`: Too many login attempts (includes Retry-After header)
     """
     auth_service = AuthService(db)
-    return auth_service.login(
+    result = await auth_service.login(
         email=request.email,
         password=request.password
     )
+    return _json_response(result)
 
 
 @router.post(
@@ -94,10 +111,10 @@ def login(
     summary="Refresh access token",
     description="Obtain new access token using refresh token (with rotation)"
 )
-def refresh(
+async def refresh(
     request: RefreshRequest,
-    db: Session = Depends(get_db)
-) -> TokenResponse:
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
     """Refresh access token using refresh token.
 
     Implements token rotation: old refresh token is revoked and a new one is issued.
@@ -115,7 +132,8 @@ def refresh(
     - `401`: Invalid or expired refresh token
     """
     auth_service = AuthService(db)
-    return auth_service.refresh_tokens(refresh_token=request.refresh_token)
+    result = await auth_service.refresh_tokens(refresh_token=request.refresh_token)
+    return _json_response(result)
 
 
 @router.post(
@@ -124,9 +142,9 @@ def refresh(
     summary="Logout user",
     description="Invalidate current session tokens"
 )
-def logout(
+async def logout(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Response:
     """Logout user by revoking all refresh tokens.
 
@@ -139,7 +157,7 @@ def logout(
     - `401`: Invalid or missing JWT token
     """
     auth_service = AuthService(db)
-    auth_service.logout(user_id=current_user.id)
+    await auth_service.logout(user_id=current_user.id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -1,7 +1,8 @@
 """Chat API endpoints for conversational AI interface."""
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from src.api.deps import get_current_user
 from src.database import get_db
@@ -69,8 +70,8 @@ async def chat(
 
             # Execute confirmed action
             result = await agent.confirmation_agent.execute_confirmed(
-                request.confirm_action["action"],
-                request.confirm_action["params"]
+                request.confirm_action.action,
+                request.confirm_action.params
             )
 
             # Get result message
@@ -135,22 +136,48 @@ async def chat(
 
 @router.get("/conversations", response_model=List[ConversationResponse])
 async def list_conversations(
+    before_updated_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: updated_at of the last conversation on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last conversation on the previous page"
+    ),
+    limit: int = Query(50, ge=1, le=100, description="Page size"),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """List all conversations for the authenticated user.
 
+    Paginate by passing the last item's `updated_at` and `id` as
+    `before_updated_at` / `before_id`; an empty page means the end.
+
     Args:
+        before_updated_at: Cursor timestamp (optional, requires before_id)
+        before_id: Cursor conversation ID (optional, requires before_updated_at)
+        limit: Maximum number of conversations to return
         user: Authenticated user from JWT
         db: Database session
 
     Returns:
         List[ConversationResponse]: User's conversations ordered by updated_at desc
+
+    Raises:
+        HTTPException 400: Only one of the two cursor parameters was given
     """
+    # A half cursor must not silently fall back to page 1 (clients would loop)
+    if (before_updated_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="before_updated_at and before_id must be provided together"
+        )
+    cursor = None
+    if before_id is not None:
+        cursor = (before_updated_at, before_id)
+
     try:
         user_id = user.id
         service = ConversationService(db, user_id)
-        conversations = service.list_conversations()
+        conversations = service.list_conversations(limit=limit, cursor=cursor)
 
         return [
             ConversationResponse(
@@ -3,7 +3,8 @@
 RESTful API routes for task CRUD operations with user ownership enforcement.
 All endpoints require JWT authentication via Authorization header.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlmodel import Session
 from uuid import UUID
 from typing import List, Optional
@@ -17,6 +18,9 @@ from src.models.task import TaskStatus, TaskPriority
 from src.utils.errors import TaskError, TaskNotFoundError, UnauthorizedAccessError
 
 
+# Compiled once: validates/serializes a whole task list in a single pydantic-core call
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
 # Create router with /tasks prefix
 router = APIRouter(
     prefix="/tasks",
@@ -119,7 +123,7 @@ def list_tasks(
         description="Sort by field (created_at, updated_at, priority, status)",
         pattern="^(created_at|updated_at|priority|status)$"
     )
-) -> List[TaskResponse]:
+) -> Response:
     """List all tasks for the authenticated user with filters.
 
     Args:
@@ -131,7 +135,7 @@ def list_tasks(
         sort_by: Sort field (default: created_at)
 
     Returns:
-        List[TaskResponse]: List of tasks matching criteria (may be empty)
+        Response: JSON list of TaskResponse objects matching criteria (may be empty)
 
     Raises:
         HTTPException 400: If filters are invalid
@@ -150,7 +154,11 @@ def list_tasks(
         sort_by=sort_by
     )
 
-    return [TaskResponse.model_validate(task) for task in tasks]
+    items = _TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
+    return Response(
+        content=_TASK_LIST_ADAPTER.dump_json(items),
+        media_type="application/json"
+    )
 
 
 @router.get(
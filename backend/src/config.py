@@ -40,8 +40,25 @@ class Settings(BaseSettings):
     jwt_issuer: str = "todo-backend-api"
     jwt_audience: str = "todo-frontend"
 
+    # Redis (optional): mirrors active refresh tokens; empty = SQL only
+    redis_url: str = ""
+
     # Security
-    bcrypt_rounds: int = 12  # Use 4 for development, 12+ for production
+    # Password hashing: argon2id for new hashes; bcrypt hashes are upgraded on login
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB (64 MiB)
+    argon2_parallelism: int = 4
+    # Concurrent password hashes. Each argon2 hash holds argon2_memory_cost
+    # KiB while it runs, so peak hashing memory is workers x memory cost
+    # (2 x 64 MiB by default). Keep this small on 512 MB instances; raise it
+    # only with RAM to match (os.cpu_count() reports host cores in containers)
+    password_hash_workers: int = 2
+    # Optional server-side secret mixed into new password hashes; never change
+    # or remove it once set, or every argon2 hash stops verifying
+    password_pepper: str = ""
+    # Remember (password, hash) verify results for 5s so client retries and
+    # form re-submits don't re-run argon2 (off by default)
+    cache_password_verifications: bool = False
 
     # LLM Configuration (defaults to Groq free tier)
     llm_base_url: str = "https://api.groq.com/openai/v1"
@@ -1,6 +1,10 @@
 """Database connection and session management using SQLModel."""
+import orjson
 from sqlmodel import create_engine, Session, SQLModel
-from typing import Generator
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+from typing import AsyncGenerator, Generator, Union
 from src.config import settings
 from src.models import User, RefreshToken, Task, Conversation, Message  # Import models for table creation
 
@@ -25,6 +29,15 @@ def _get_database_url() -> str:
     return url
 
 
+def _json_serializer(value) -> str:
+    """Serialize JSON/JSONB column values with orjson (drivers expect str)."""
+    return orjson.dumps(value).decode()
+
+
+# Used by every JSON-typed column (task tags, message metadata)
+_JSON_CODEC = {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+
+
 db_url = _get_database_url()
 print(f"Using database URL starting with: {db_url[:30]}...")
 
@@ -34,7 +47,8 @@ if db_url.startswith("sqlite"):
     engine = create_engine(
         db_url,
         echo=settings.debug,
-        connect_args={"check_same_thread": False}  # Required for SQLite with FastAPI
+        connect_args={"check_same_thread": False},  # Required for SQLite with FastAPI
+        **_JSON_CODEC,
     )
 else:
     # PostgreSQL configuration (for production with Neon Serverless)
@@ -43,6 +57,28 @@ else:
         echo=settings.debug,  # Log SQL queries in debug mode
         pool_pre_ping=True,   # Verify connections before using (important for serverless)
         pool_recycle=3600,    # Recycle connections after 1 hour
+        **_JSON_CODEC,
+    )
+
+
+def _get_async_database_url(url: str) -> str:
+    """Map the sync URL to its async driver (psycopg v3 async / aiosqlite)."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url  # postgresql+psycopg:// supports asyncio natively
+
+
+# Async engine for request paths that await the database (auth service)
+async_db_url = _get_async_database_url(db_url)
+if async_db_url.startswith("sqlite"):
+    async_engine = create_async_engine(async_db_url, echo=settings.debug, **_JSON_CODEC)
+else:
+    async_engine = create_async_engine(
+        async_db_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        **_JSON_CODEC,
     )
 
 
@@ -55,6 +91,24 @@ def create_db_and_tables() -> None:
     SQLModel.metadata.create_all(engine)
 
 
+def dialect_insert(db: Union[Session, AsyncSession], model):
+    """Build an INSERT for the session's dialect that supports ON CONFLICT.
+
+    PostgreSQL (production) and SQLite (local) both implement
+    `on_conflict_do_nothing()`, but through dialect-specific constructs.
+
+    Args:
+        db: Session (sync or async) whose bind decides the dialect
+        model: SQLModel table class to insert into
+
+    Returns:
+        Dialect-specific Insert construct
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
 def get_db() -> Generator[Session, None, None]:
     """Dependency injection function for FastAPI.
 
@@ -67,3 +121,19 @@ def get_db() -> Generator[Session, None, None]:
     """
     with Session(engine) as session:
         yield session
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async dependency injection function for FastAPI.
+
+    Yields an AsyncSession so database round trips don't block the event loop.
+    expire_on_commit is disabled: attributes stay loaded after commit instead
+    of triggering implicit (unsupported) lazy loads in async code.
+
+    Usage in FastAPI:
+        @router.post("/")
+        async def endpoint(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
@@ -18,8 +18,9 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 from src.config import settings
-from src.database import create_db_and_tables
+from src.database import create_db_and_tables, async_engine
 from src.api.routes import tasks, auth, chat
+from src.services.auth_service import shutdown_hash_pool
 from src.utils.errors import TaskError, TaskNotFoundError, UnauthorizedAccessError, AuthError
 from src.schemas.error_schemas import ErrorResponse, ErrorDetail
 
@@ -30,7 +31,7 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events:
     - Startup: Initialize database tables
-    - Shutdown: Clean up resources (if needed)
+    - Shutdown: Stop the password hashing worker pool and close async DB connections
 
     Args:
         app: FastAPI application instance
@@ -47,6 +48,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Clean up resources (if needed)
     print("Shutting down: Cleaning up resources...")
+    shutdown_hash_pool()
+    await async_engine.dispose()
 
 
 # Create FastAPI application
@@ -1,8 +1,13 @@
 """Conversation SQLModel for database table and ORM operations."""
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from datetime import datetime
 from uuid import UUID, uuid4
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
+from src.models.timestamps import created_at_column, updated_at_column
+
+if TYPE_CHECKING:
+    from src.models.message import Message
 
 
 class Conversation(SQLModel, table=True):
@@ -14,9 +19,15 @@ class Conversation(SQLModel, table=True):
         title: Optional conversation title (auto-generated from first message if None)
         created_at: Timestamp when conversation was created (auto-generated)
         updated_at: Timestamp when conversation was last modified (auto-updated)
+        messages: Messages in the conversation, ordered by created_at
     """
     __tablename__ = "conversations"
 
+    # user_id + (updated_at, id) DESC serves list_conversations' keyset pages without a sort
+    __table_args__ = (
+        Index("idx_conversations_user_updated", "user_id", text("updated_at DESC"), text("id DESC")),
+    )
+
     # Primary key
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
@@ -27,5 +38,15 @@ class Conversation(SQLModel, table=True):
     title: Optional[str] = Field(default=None, max_length=255)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: Optional[datetime] = Field(default=None, sa_column=created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=updated_at_column())
+
+    # Messages (deletes rely on the FK's ON DELETE CASCADE; nothing is loaded)
+    messages: List["Message"] = Relationship(
+        back_populates="conversation",
+        sa_relationship_kwargs={
+            "order_by": "Message.created_at",
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
+    )
@@ -1,8 +1,13 @@
 """Message SQLModel for database table and ORM operations."""
-from sqlmodel import SQLModel, Field, Column
+from sqlmodel import SQLModel, Field, Column, Relationship
 from sqlalchemy import JSON, Index
 from datetime import datetime
 from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Optional
+from src.models.timestamps import created_at_column
+
+if TYPE_CHECKING:
+    from src.models.conversation import Conversation
 
 
 class Message(SQLModel, table=True):
@@ -15,14 +20,18 @@ class Message(SQLModel, table=True):
         content: Message text content (required)
         message_metadata: Additional metadata (tool calls, confirmations, etc.) stored as JSON
         created_at: Timestamp when message was created (auto-generated)
+        conversation: Parent conversation
     """
     __tablename__ = "messages"
 
     # Primary key
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
-    # Foreign key to conversation (indexed for fast conversation queries)
-    conversation_id: UUID = Field(foreign_key="conversations.id", index=True, nullable=False)
+    # Foreign key to conversation (indexed for fast conversation queries);
+    # deleting a conversation cascades to its messages at the database level
+    conversation_id: UUID = Field(
+        foreign_key="conversations.id", ondelete="CASCADE", index=True, nullable=False
+    )
 
     # Message content
     role: str = Field(max_length=50, nullable=False)  # "user" | "assistant" | "system"
@@ -33,7 +42,9 @@ class Message(SQLModel, table=True):
     message_metadata: dict = Field(default={}, sa_column=Column(JSON))
 
     # Timestamp
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: Optional[datetime] = Field(default=None, sa_column=created_at_column())
+
+    conversation: Optional["Conversation"] = Relationship(back_populates="messages")
 
     # Composite index for conversation_id + created_at (common query pattern)
     __table_args__ = (
@@ -1,10 +1,12 @@
 """Task SQLModel for database table and ORM operations."""
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON, Index
+from sqlalchemy import JSON, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from uuid import UUID, uuid4
 from enum import Enum
 from typing import Optional
+from src.models.timestamps import created_at_column, updated_at_column
 
 
 class TaskStatus(str, Enum):
@@ -21,6 +23,15 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+# Ordinal rank for sorting by priority (high > medium > low). Enum columns store
+# member names, so the CASE matches on those. Shared verbatim by the
+# list_tasks ORDER BY and the expression index so Postgres can use the index.
+PRIORITY_RANK_SQL = (
+    f"CASE priority WHEN '{TaskPriority.HIGH.name}' THEN 3 "
+    f"WHEN '{TaskPriority.MEDIUM.name}' THEN 2 ELSE 1 END"
+)
+
+
 class Task(SQLModel, table=True):
     """Task database model representing a todo item.
 
@@ -51,14 +62,23 @@ class Task(SQLModel, table=True):
     status: TaskStatus = Field(default=TaskStatus.TODO, index=True)
     priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
 
-    # Tags stored as JSON (compatible with both SQLite and PostgreSQL)
-    tags: list[str] = Field(default=[], sa_column=Column(JSON))
+    # Tags stored as JSON (JSONB on PostgreSQL so tag filters can use @> and a GIN index)
+    tags: list[str] = Field(default=[], sa_column=Column(JSON().with_variant(JSONB(), "postgresql")))
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: Optional[datetime] = Field(default=None, sa_column=created_at_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=updated_at_column())
 
-    # Composite index for user_id + status (common query pattern)
+    # Composite index for user_id + status (common query pattern);
+    # user_id + created_at DESC serves the default list ordering without a sort
     __table_args__ = (
         Index("idx_tasks_user_status", "user_id", "status"),
+        Index("idx_tasks_user_created", "user_id", text("created_at DESC")),
+        Index("idx_tasks_tags", "tags", postgresql_using="gin"),
+        Index(
+            "idx_tasks_user_priority",
+            "user_id",
+            text(f"({PRIORITY_RANK_SQL}) DESC"),
+            text("created_at DESC"),
+        ),
     )
@@ -0,0 +1,54 @@
+"""Database-side UTC timestamps for created_at / updated_at columns.
+
+`utcnow()` renders as the database's own UTC clock, so rows get their
+timestamps from the server instead of a Python `datetime` bound per INSERT.
+It is emitted inline in each INSERT as well as declared as the server
+default, because tables created by earlier releases have no DEFAULT.
+Columns stay naive UTC (`timestamp without time zone`), matching existing data.
+"""
+from sqlalchemy import Column, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """Current UTC time evaluated by the database."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # CURRENT_TIMESTAMP only has second resolution on SQLite; keep milliseconds
+    # so messages written in the same second still order correctly. %f gives
+    # SS.SSS; pad to the 6 fractional digits SQLAlchemy binds for DateTime so
+    # server defaults and bound values compare consistently as text (keyset
+    # cursors compare them with <)
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+def created_at_column() -> Column:
+    """Column set by the database clock on INSERT.
+
+    `default` renders `utcnow()` into every INSERT, so tables created before
+    the server default existed (NOT NULL, no DEFAULT) still get a value;
+    `server_default` covers freshly created tables and raw SQL.
+    """
+    return Column(DateTime, default=utcnow(), server_default=utcnow(), nullable=False)
+
+
+def updated_at_column() -> Column:
+    """Column set on INSERT (as above) and refreshed on every ORM UPDATE."""
+    return Column(
+        DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow(), nullable=False
+    )
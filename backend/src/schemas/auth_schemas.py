@@ -1,9 +1,32 @@
 """Pydantic schemas for authentication request/response validation."""
-from pydantic import BaseModel, EmailStr, Field
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from email_validator import validate_email, EmailNotValidError
 from datetime import datetime
 from uuid import UUID
 
 
+@lru_cache(maxsize=4096)
+def _normalize_email(v: str) -> str:
+    """Validate and normalize an email address (cached per raw input).
+
+    Repeat submissions of the same address (login retries, the same user
+    signing in again) skip the RFC syntax check and IDNA encoding.
+    Invalid input raises before returning, so it never enters the cache.
+    """
+    return validate_email(v, check_deliverability=False).normalized.lower()
+
+
+def _validate_email_field(v):
+    """Shared `mode="before"` email validator for request schemas."""
+    if not isinstance(v, str):
+        return v
+    try:
+        return _normalize_email(v)
+    except EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}") from None
+
+
 # Request Schemas
 
 class RegisterRequest(BaseModel):
@@ -13,14 +36,16 @@ class RegisterRequest(BaseModel):
         email: User's email address (validated format)
         password: Plain text password (min 8 chars, will be hashed)
     """
-    email: EmailStr = Field(..., max_length=255, description="User's email address")
+    email: str = Field(..., max_length=255, description="User's email address")
     password: str = Field(
         ...,
         min_length=8,
         max_length=128,
-        description="Password (min 8 chars, at least one letter and one number)"
+        description="Password (min 8 chars, with uppercase, lowercase, digit and special character)"
     )
 
+    _check_email = field_validator("email", mode="before")(_validate_email_field)
+
 
 class LoginRequest(BaseModel):
     """User login request payload.
@@ -29,9 +54,11 @@ class LoginRequest(BaseModel):
         email: User's email address
         password: Plain text password
     """
-    email: EmailStr = Field(..., max_length=255, description="User's email address")
+    email: str = Field(..., max_length=255, description="User's email address")
     password: str = Field(..., max_length=128, description="User's password")
 
+    _check_email = field_validator("email", mode="before")(_validate_email_field)
+
 
 class RefreshRequest(BaseModel):
     """Token refresh request payload.
@@ -60,8 +87,7 @@ class UserProfile(BaseModel):
     is_active: bool = Field(default=True, description="Account status")
     created_at: datetime = Field(..., description="Account creation timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
@@ -76,7 +102,7 @@ class TokenResponse(BaseModel):
     access_token: str = Field(..., description="New JWT access token")
     refresh_token: str = Field(..., description="New refresh token (rotation)")
     token_type: str = Field(default="bearer", description="Token type")
-    expires_in: int = Field(..., description="Access token expiry in seconds", example=900)
+    expires_in: int = Field(..., description="Access token expiry in seconds", examples=[900])
 
 
 class AuthResponse(BaseModel):
@@ -95,4 +121,4 @@ class AuthResponse(BaseModel):
     access_token: str = Field(..., description="JWT access token (15 min expiry)")
     refresh_token: str = Field(..., description="Opaque refresh token (7 day expiry)")
     token_type: str = Field(default="bearer", description="Token type")
-    expires_in: int = Field(..., description="Access token expiry in seconds", example=900)
+    expires_in: int = Field(..., description="Access token expiry in seconds", examples=[900])
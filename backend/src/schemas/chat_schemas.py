@@ -1,9 +1,22 @@
 """Pydantic schemas for chat endpoints."""
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Optional
 from datetime import datetime
 
 
+class ConfirmAction(BaseModel):
+    """Confirmation response for a destructive operation.
+
+    Attributes:
+        action: Name of the confirmed action (e.g. "delete_task")
+        params: Parameters for the action, echoed back from the confirmation request
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    action: str = Field(..., min_length=1, description="Confirmed action name")
+    params: dict[str, Any] = Field(default_factory=dict, description="Action parameters")
+
+
 class ChatRequest(BaseModel):
     """Request schema for chat endpoint.
 
@@ -14,7 +27,7 @@ class ChatRequest(BaseModel):
     """
     message: str = Field(..., min_length=1, description="User's message")
     conversation_id: Optional[str] = Field(None, description="Conversation ID to continue")
-    confirm_action: Optional[dict] = Field(None, description="Confirmation response with action and params")
+    confirm_action: Optional[ConfirmAction] = Field(None, description="Confirmation response with action and params")
 
 
 class ChatResponse(BaseModel):
@@ -8,7 +8,26 @@ All API errors follow the format:
     }
 }
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Built once at import and shared by reference with the OpenAPI generator
+_ERROR_RESPONSE_EXAMPLES = {
+    "examples": [
+        {
+            "error": {
+                "code": 404,
+                "message": "Task not found"
+            }
+        },
+        {
+            "error": {
+                "code": 400,
+                "message": "user_id is required"
+            }
+        }
+    ]
+}
 
 
 class ErrorDetail(BaseModel):
@@ -23,13 +42,13 @@ class ErrorDetail(BaseModel):
         description="HTTP status code",
         ge=100,
         le=599,
-        examples=[400, 404, 500]
+        examples=[404]
     )
     message: str = Field(
         ...,
         description="Human-readable error message",
         min_length=1,
-        examples=["Task not found", "Validation failed"]
+        examples=["Task not found"]
     )
 
 
@@ -46,21 +65,4 @@ class ErrorResponse(BaseModel):
         description="Error details"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "examples": [
-                {
-                    "error": {
-                        "code": 404,
-                        "message": "Task not found"
-                    }
-                },
-                {
-                    "error": {
-                        "code": 400,
-                        "message": "user_id is required"
-                    }
-                }
-            ]
-        }
+    model_config = ConfigDict(json_schema_extra=_ERROR_RESPONSE_EXAMPLES)
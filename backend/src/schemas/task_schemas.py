@@ -3,13 +3,31 @@
 These schemas define the API contract for task-related endpoints,
 ensuring type safety and automatic validation.
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
 from src.models.task import TaskStatus, TaskPriority
 
 
+# Built once at import and shared by reference with the OpenAPI generator
+_TASK_RESPONSE_EXAMPLES = {
+    "examples": [
+        {
+            "id": "550e8400-e29b-41d4-a716-446655440000",
+            "user_id": "user123",
+            "title": "Complete backend API",
+            "description": "Implement all FastAPI endpoints",
+            "status": "in-progress",
+            "priority": "high",
+            "tags": ["backend", "api"],
+            "created_at": "2024-01-24T10:30:00Z",
+            "updated_at": "2024-01-24T15:45:00Z"
+        }
+    ]
+}
+
+
 class TaskCreate(BaseModel):
     """Schema for creating a new task.
 
@@ -219,21 +237,7 @@ class TaskResponse(BaseModel):
         description="Last modification timestamp"
     )
 
-    class Config:
-        """Pydantic configuration for ORM compatibility."""
-        from_attributes = True  # Enable ORM mode for SQLModel integration
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "user_id": "user123",
-                    "title": "Complete backend API",
-                    "description": "Implement all FastAPI endpoints",
-                    "status": "in-progress",
-                    "priority": "high",
-                    "tags": ["backend", "api"],
-                    "created_at": "2024-01-24T10:30:00Z",
-                    "updated_at": "2024-01-24T15:45:00Z"
-                }
-            ]
-        }
+    model_config = ConfigDict(
+        from_attributes=True,  # Enable ORM mode for SQLModel integration
+        json_schema_extra=_TASK_RESPONSE_EXAMPLES
+    )
@@ -1,24 +1,31 @@
 """Authentication service with business logic for user registration, login, logout, and token management.
 
 Security features:
-- Bcrypt password hashing with configurable work factor
+- Argon2id password hashing (legacy bcrypt hashes upgraded on login)
 - JWT access tokens with iss/aud claims
 - Refresh token rotation (old token revoked on refresh)
 - SHA-256 hashed token storage (never stores raw tokens)
+- Optional Redis mirror of active refresh tokens (SQL stays authoritative)
 - Rate limiting on login attempts
 - Generic error messages (prevents user enumeration)
 """
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 from uuid import UUID
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import bindparam, update
 from fastapi import HTTPException
 from src.models.user import User
 from src.models.refresh_token import RefreshToken
+from src.database import dialect_insert
 from src.schemas.auth_schemas import AuthResponse, TokenResponse, UserProfile
 from src.utils.security import (
     hash_password,
-    verify_password,
+    verify_and_upgrade_password,
     validate_email,
     normalize_email,
     validate_password,
@@ -27,17 +34,73 @@ from src.utils.security import (
     hash_refresh_token,
 )
 from src.utils.rate_limiter import login_rate_limiter
+from src.utils.token_cache import (
+    cache_refresh_token,
+    consume_refresh_token,
+    evict_user_refresh_tokens,
+)
 from src.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Password hashing (argon2id / legacy bcrypt) is CPU-bound by design. Both C
+# extensions release the GIL while hashing, so a thread pool is enough for
+# concurrent logins/registrations to run in parallel. Sized by
+# PASSWORD_HASH_WORKERS, not cpu_count: each argon2 hash holds
+# ARGON2_MEMORY_COST of RAM, and containers report the host's core count
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=max(1, settings.password_hash_workers), thread_name_prefix="pwhash"
+)
+
+
+async def _run_hasher(func, *args):
+    """Run a password hash/verify call in the hashing pool without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_HASH_POOL, func, *args)
+
+
+def _auth_error(status_code: int, message: str) -> HTTPException:
+    """Build an HTTPException with the standard error envelope.
+
+    Always raise a fresh instance: a shared module-level exception would
+    accumulate a traceback (and keep request frames alive) on every raise.
+    """
+    return HTTPException(status_code=status_code, detail={
+        "error": {
+            "code": status_code,
+            "message": message
+        }
+    })
+
+
+# Generic message for all refresh failure cases (prevents enumeration)
+_INVALID_REFRESH_TOKEN_MSG = "Invalid or expired refresh token"
+
+# Hot-path statements built once; values are bound per call via params=
+# User lookups project only the columns the auth flows read (plain rows, no
+# ORM identity-map entry); password_hash is only fetched for login
+_SELECT_LOGIN_BY_EMAIL = select(
+    User.id, User.email, User.password_hash, User.is_active, User.created_at
+).where(User.email == bindparam("email"))
+_SELECT_USER_BY_ID = select(
+    User.id, User.email, User.is_active, User.created_at
+).where(User.id == bindparam("user_id"))
+_SELECT_TOKEN_BY_HASH = select(RefreshToken).where(RefreshToken.token_hash == bindparam("token_hash"))
+
+
+def shutdown_hash_pool() -> None:
+    """Stop the password hashing worker threads (called on application shutdown)."""
+    _HASH_POOL.shutdown(wait=False, cancel_futures=True)
+
 
 def utc_now() -> datetime:
     """Return current UTC time as timezone-aware datetime."""
     return datetime.now(timezone.utc)
 
 
+# Response models below are built with model_construct: every value comes from
+# the database or is generated here, so re-validating it would only add cost
+
 class AuthService:
     """Service class for authentication operations.
 
@@ -45,15 +108,30 @@ class AuthService:
     All business logic is centralized here, routes delegate to this service.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize auth service with database session.
 
         Args:
-            db: SQLModel database session
+            db: SQLModel async database session (queries never block the event loop)
         """
         self.db = db
+        # Refresh tokens staged in the current transaction, mirrored to Redis on commit
+        self._pending_tokens: list[RefreshToken] = []
+
+    async def _commit(self) -> None:
+        """Commit the current transaction, then mirror newly issued refresh tokens.
+
+        Redis is only written after the commit succeeds, so the mirror never
+        holds a token the database does not have.
+        """
+        await self.db.commit()
+        pending, self._pending_tokens = self._pending_tokens, []
+        for record in pending:
+            await cache_refresh_token(
+                record.token_hash, record.user_id, int(record.expires_at.timestamp())
+            )
 
-    def register(self, email: str, password: str) -> AuthResponse:
+    async def register(self, email: str, password: str) -> AuthResponse:
         """Register a new user account.
 
         Validates email format, password strength, checks for duplicate email,
@@ -72,46 +150,23 @@ class AuthService:
         """
         # Validate email format
         if not validate_email(email):
-            logger.warning(f"Registration failed: invalid email format - {email}")
-            raise HTTPException(status_code=400, detail={
-                "error": {
-                    "code": 400,
-                    "message": "Invalid email format"
-                }
-            })
+            logger.warning("Registration failed: invalid email format - %s", email)
+            raise _auth_error(400, "Invalid email format")
 
         # Validate password strength
         is_valid, error_msg = validate_password(password)
         if not is_valid:
-            logger.warning(f"Registration failed: weak password for {email}")
-            raise HTTPException(status_code=400, detail={
-                "error": {
-                    "code": 400,
-                    "message": f"{error_msg} with at least one letter and one number"
-                }
-            })
+            logger.warning("Registration failed: weak password for %s", email)
+            raise _auth_error(400, f"{error_msg} with at least one letter and one number")
 
         # Normalize email to lowercase
         normalized_email = normalize_email(email)
 
-        # Check for duplicate email
-        existing_user = self.db.exec(
-            select(User).where(User.email == normalized_email)
-        ).first()
+        # Hash password using argon2id (off the event loop)
+        hashed = await _run_hasher(hash_password, password)
 
-        if existing_user:
-            logger.warning(f"Registration failed: duplicate email - {normalized_email}")
-            raise HTTPException(status_code=409, detail={
-                "error": {
-                    "code": 409,
-                    "message": "Email already registered"
-                }
-            })
-
-        # Hash password using bcrypt
-        hashed = hash_password(password)
-
-        # Create user with hashed password
+        # Insert user; the unique email index turns a duplicate into
+        # a no-op, so the duplicate check and INSERT are one statement
         now = utc_now()
         user = User(
             email=normalized_email,
@@ -120,21 +175,30 @@ class AuthService:
             created_at=now,
             updated_at=now
         )
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        inserted = (await self.db.exec(
+            dialect_insert(self.db, User)
+            .values(user.model_dump())
+            .on_conflict_do_nothing()
+            .returning(User.created_at)
+        )).first()
 
-        logger.info(f"User registered successfully: {user.id} ({user.email})")
+        if inserted is None:
+            logger.warning("Registration failed: duplicate email - %s", normalized_email)
+            raise _auth_error(409, "Email already registered")
 
-        # Generate tokens
-        access_token, refresh_token = self._create_token_pair(user)
+        # Generate tokens; user and refresh token rows commit in one transaction
+        access_token, refresh_token = await self._create_token_pair(user.id, user.email)
+        await self._commit()
 
-        return AuthResponse(
-            user=UserProfile(
+        logger.info("User registered successfully: %s (%s)", user.id, user.email)
+
+        return AuthResponse.model_construct(
+            user=UserProfile.model_construct(
                 id=user.id,
                 email=user.email,
                 is_active=user.is_active,
-                created_at=user.created_at
+                # Stored (naive UTC) value, as login and refresh read it back
+                created_at=inserted.created_at
             ),
             access_token=access_token,
             refresh_token=refresh_token,
@@ -142,7 +206,7 @@ class AuthService:
             expires_in=settings.jwt_access_expire_minutes * 60
         )
 
-    def login(self, email: str, password: str) -> AuthResponse:
+    async def login(self, email: str, password: str) -> AuthResponse:
         """Authenticate user and issue tokens.
 
         Validates credentials, checks rate limiting, verifies password,
@@ -161,10 +225,10 @@ class AuthService:
         """
         normalized_email = normalize_email(email)
 
-        # Check rate limiting
-        if not login_rate_limiter.is_allowed(normalized_email):
-            retry_after = login_rate_limiter.get_retry_after(normalized_email)
-            logger.warning(f"Login rate limited: {normalized_email}")
+        # Check rate limiting; the attempt is counted up front (cleared on success)
+        allowed, retry_after = await login_rate_limiter.check_and_record(normalized_email)
+        if not allowed:
+            logger.warning("Login rate limited: %s", normalized_email)
             raise HTTPException(
                 status_code=429,
                 detail={
@@ -177,41 +241,41 @@ class AuthService:
             )
 
         # Find user by email
-        user = self.db.exec(
-            select(User).where(User.email == normalized_email)
-        ).first()
+        user = (await self.db.exec(
+            _SELECT_LOGIN_BY_EMAIL, params={"email": normalized_email}
+        )).first()
 
         # Verify credentials (generic error prevents user enumeration)
-        if not user or not verify_password(password, user.password_hash):
-            login_rate_limiter.record_attempt(normalized_email)
-            logger.warning(f"Login failed: invalid credentials for {normalized_email}")
-            raise HTTPException(status_code=401, detail={
-                "error": {
-                    "code": 401,
-                    "message": "Invalid credentials"
-                }
-            })
+        valid, upgraded_hash = (
+            await _run_hasher(verify_and_upgrade_password, password, user.password_hash)
+            if user else (False, None)
+        )
+        if not valid:
+            logger.warning("Login failed: invalid credentials for %s", normalized_email)
+            raise _auth_error(401, "Invalid credentials")
 
         # Check if account is disabled
         if not user.is_active:
-            logger.warning(f"Login failed: account disabled for {normalized_email}")
-            raise HTTPException(status_code=401, detail={
-                "error": {
-                    "code": 401,
-                    "message": "Account disabled"
-                }
-            })
+            logger.warning("Login failed: account disabled for %s", normalized_email)
+            raise _auth_error(401, "Account disabled")
 
         # Clear rate limit on successful login
-        login_rate_limiter.clear_attempts(normalized_email)
+        await login_rate_limiter.reset(normalized_email)
 
-        logger.info(f"User logged in successfully: {user.id} ({user.email})")
+        # Store the re-hashed password (legacy bcrypt -> argon2id); commits with the new token
+        if upgraded_hash is not None:
+            await self.db.exec(
+                update(User).where(User.id == user.id).values(password_hash=upgraded_hash)
+            )
 
         # Generate tokens
-        access_token, refresh_token = self._create_token_pair(user)
+        access_token, refresh_token = await self._create_token_pair(user.id, user.email)
+        await self._commit()
 
-        return AuthResponse(
-            user=UserProfile(
+        logger.info("User logged in successfully: %s (%s)", user.id, user.email)
+
+        return AuthResponse.model_construct(
+            user=UserProfile.model_construct(
                 id=user.id,
                 email=user.email,
                 is_active=user.is_active,
@@ -223,11 +287,13 @@ class AuthService:
             expires_in=settings.jwt_access_expire_minutes * 60
         )
 
-    def refresh_tokens(self, refresh_token: str) -> TokenResponse:
+    async def refresh_tokens(self, refresh_token: str) -> TokenResponse:
         """Refresh access token using refresh token with rotation.
 
         Security features:
-        - O(1) lookup via indexed token_hash (no linear scan)
+        - O(1) lookup via Redis mirror (if configured), else indexed token_hash
+        - Database stays authoritative: a cached hit is only accepted if the
+          conditional revoke UPDATE finds the token still active
         - Token rotation: old token revoked immediately
         - Generic error messages prevent token enumeration
 
@@ -243,70 +309,85 @@ class AuthService:
         # Compute hash for O(1) database lookup (token_hash is indexed)
         token_hash = hash_refresh_token(refresh_token)
 
-        # Direct lookup by hash - O(1) instead of O(n) linear scan
-        matching_token = self.db.exec(
-            select(RefreshToken).where(RefreshToken.token_hash == token_hash)
-        ).first()
-
-        # Generic error for all failure cases (prevents enumeration)
-        invalid_token_error = HTTPException(status_code=401, detail={
-            "error": {
-                "code": 401,
-                "message": "Invalid or expired refresh token"
-            }
-        })
-
-        # Validate token exists
-        if not matching_token:
-            logger.warning("Refresh failed: token not found")
-            raise invalid_token_error
-
-        # Check if token is revoked
-        if matching_token.revoked_at is not None:
-            logger.warning(f"Refresh failed: token already revoked - {matching_token.id}")
-            raise invalid_token_error
-
-        # Check if token is expired (use timezone-aware comparison)
         now = utc_now()
-        # Handle both naive and aware datetimes for backwards compatibility
-        expires_at = matching_token.expires_at
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-        if expires_at < now:
-            logger.warning(f"Refresh failed: token expired - {matching_token.id}")
-            raise invalid_token_error
+
+        # Fast path: Redis mirror hit (atomically consumed) skips the token SELECT
+        cached = await consume_refresh_token(token_hash)
+        matching_token = None
+        if cached is not None:
+            user_id, expires_ts = cached
+            if expires_ts < time.time():
+                logger.warning("Refresh failed: token expired (cached)")
+                raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
+
+            # Revoke in SQL (durable truth); no row updated means it was already revoked
+            revoked = await self.db.exec(
+                update(RefreshToken)
+                .where(RefreshToken.token_hash == token_hash)
+                .where(RefreshToken.revoked_at.is_(None))
+                .values(revoked_at=now)
+            )
+            if revoked.rowcount == 0:
+                logger.warning("Refresh failed: cached token not active in database")
+                raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
+        else:
+            # Direct lookup by hash - O(1) instead of O(n) linear scan
+            matching_token = (await self.db.exec(
+                _SELECT_TOKEN_BY_HASH, params={"token_hash": token_hash}
+            )).first()
+
+            # Validate token exists
+            if not matching_token:
+                logger.warning("Refresh failed: token not found")
+                raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
+
+            # Check if token is revoked
+            if matching_token.revoked_at is not None:
+                logger.warning("Refresh failed: token already revoked - %s", matching_token.id)
+                raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
+
+            # Check if token is expired
+            expires_at = matching_token.expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at < now:
+                logger.warning("Refresh failed: token expired - %s", matching_token.id)
+                raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
+
+            user_id = matching_token.user_id
 
         # Get user and verify active
-        user = self.db.exec(
-            select(User).where(User.id == matching_token.user_id)
-        ).first()
+        user = (await self.db.exec(
+            _SELECT_USER_BY_ID, params={"user_id": user_id}
+        )).first()
 
         if not user:
-            logger.error(f"Refresh failed: user not found - {matching_token.user_id}")
-            raise invalid_token_error
+            logger.error("Refresh failed: user not found - %s", user_id)
+            raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
 
         if not user.is_active:
-            logger.warning(f"Refresh failed: user disabled - {user.id}")
-            raise invalid_token_error
+            logger.warning("Refresh failed: user disabled - %s", user.id)
+            raise _auth_error(401, _INVALID_REFRESH_TOKEN_MSG)
 
         # Revoke old token immediately (rotation)
-        matching_token.revoked_at = now
-        self.db.add(matching_token)
-        self.db.commit()
+        if matching_token is not None:
+            matching_token.revoked_at = now
+            self.db.add(matching_token)
 
-        logger.info(f"Tokens refreshed for user: {user.id} ({user.email})")
+        # Generate new token pair; revoke + insert commit in one transaction
+        access_token, new_refresh_token = await self._create_token_pair(user.id, user.email)
+        await self._commit()
 
-        # Generate new token pair
-        access_token, new_refresh_token = self._create_token_pair(user)
+        logger.info("Tokens refreshed for user: %s (%s)", user.id, user.email)
 
-        return TokenResponse(
+        return TokenResponse.model_construct(
             access_token=access_token,
             refresh_token=new_refresh_token,
             token_type="bearer",
             expires_in=settings.jwt_access_expire_minutes * 60
         )
 
-    def logout(self, user_id: UUID) -> None:
+    async def logout(self, user_id: UUID) -> None:
         """Revoke all refresh tokens for a user (logout from all devices).
 
         This invalidates all active sessions for the user, requiring
@@ -319,33 +400,24 @@ class AuthService:
             HTTPException 401: User not found
         """
         # Verify user exists
-        user = self.db.exec(select(User).where(User.id == user_id)).first()
+        user = (await self.db.exec(_SELECT_USER_BY_ID, params={"user_id": user_id})).first()
         if not user:
-            logger.warning(f"Logout failed: user not found - {user_id}")
-            raise HTTPException(status_code=401, detail={
-                "error": {
-                    "code": 401,
-                    "message": "Invalid token"
-                }
-            })
-
-        # Revoke all active refresh tokens for user
-        active_tokens = self.db.exec(
-            select(RefreshToken)
+            logger.warning("Logout failed: user not found - %s", user_id)
+            raise _auth_error(401, "Invalid token")
+
+        # Revoke all active refresh tokens for user in one UPDATE
+        result = await self.db.exec(
+            update(RefreshToken)
             .where(RefreshToken.user_id == user_id)
             .where(RefreshToken.revoked_at.is_(None))
-        ).all()
-
-        now = utc_now()
-        for token in active_tokens:
-            token.revoked_at = now
-            self.db.add(token)
-
-        self.db.commit()
+            .values(revoked_at=utc_now())
+        )
+        await self.db.commit()
+        await evict_user_refresh_tokens(user_id)
 
-        logger.info(f"User logged out: {user.id} ({user.email}) - {len(active_tokens)} tokens revoked")
+        logger.info("User logged out: %s (%s) - %s tokens revoked", user.id, user.email, result.rowcount)
 
-    def get_user_profile(self, user_id: UUID) -> UserProfile:
+    async def get_user_profile(self, user_id: UUID) -> UserProfile:
         """Get user profile by ID.
 
         Args:
@@ -357,42 +429,39 @@ class AuthService:
         Raises:
             HTTPException 404: User not found
         """
-        user = self.db.exec(select(User).where(User.id == user_id)).first()
+        user = (await self.db.exec(_SELECT_USER_BY_ID, params={"user_id": user_id})).first()
 
         if not user:
-            logger.warning(f"Get profile failed: user not found - {user_id}")
-            raise HTTPException(status_code=404, detail={
-                "error": {
-                    "code": 404,
-                    "message": "User not found"
-                }
-            })
-
-        return UserProfile(
+            logger.warning("Get profile failed: user not found - %s", user_id)
+            raise _auth_error(404, "User not found")
+
+        return UserProfile.model_construct(
             id=user.id,
             email=user.email,
             is_active=user.is_active,
             created_at=user.created_at
         )
 
-    def _create_token_pair(self, user: User) -> Tuple[str, str]:
+    async def _create_token_pair(self, user_id: UUID, email: str) -> Tuple[str, str]:
         """Create access + refresh token pair for authenticated user.
 
+        The refresh token row is only added to the session; the caller commits
+        it together with the rest of its transaction via `_commit()`.
+
         Security notes:
         - Access token: JWT with iss/aud/exp/type claims
         - Refresh token: Opaque token, stored as SHA-256 hash
         - Never logs or returns the raw refresh token hash
 
         Args:
-            user: Authenticated user entity
+            user_id: Authenticated user's ID
+            email: Authenticated user's (normalized) email
 
         Returns:
             Tuple of (access_token, raw_refresh_token)
         """
         # Create JWT access token with security claims
-        access_token = create_access_token(
-            data={"sub": str(user.id), "email": user.email}
-        )
+        access_token = create_access_token(data={"sub": str(user_id), "email": email})
 
         # Generate opaque refresh token (raw + hash)
         raw_refresh_token, hashed_refresh_token = generate_refresh_token()
@@ -400,12 +469,12 @@ class AuthService:
         # Store only the hash in database (never raw token)
         now = utc_now()
         refresh_token_record = RefreshToken(
-            user_id=user.id,
+            user_id=user_id,
             token_hash=hashed_refresh_token,
             expires_at=now + timedelta(days=settings.jwt_refresh_expire_days),
             created_at=now
         )
         self.db.add(refresh_token_record)
-        self.db.commit()
+        self._pending_tokens.append(refresh_token_record)
 
         return access_token, raw_refresh_token
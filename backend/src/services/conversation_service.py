@@ -4,10 +4,13 @@ ConversationService encapsulates all conversation-related business logic and dat
 enforcing user ownership and data integrity rules.
 """
 from sqlmodel import Session, select
-from uuid import UUID
+from sqlalchemy import delete, exists, insert, literal, tuple_, update
+from sqlalchemy.orm import joinedload
+from uuid import UUID, uuid4
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.models.conversation import Conversation
+from src.models.timestamps import utcnow
 from src.models.message import Message
 from src.utils.errors import ConversationNotFoundError, UnauthorizedAccessError
 
@@ -48,9 +51,7 @@ class ConversationService:
         # Create conversation with user ownership
         conversation = Conversation(
             user_id=self.user_id,
-            title=title,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            title=title
         )
 
         # Persist to database
@@ -60,11 +61,12 @@ class ConversationService:
 
         return conversation
 
-    def get_conversation(self, conversation_id: UUID) -> Conversation:
+    def get_conversation(self, conversation_id: UUID, options: Optional[list] = None) -> Conversation:
         """Get a single conversation by ID.
 
         Args:
             conversation_id: UUID of the conversation to retrieve
+            options: Optional loader options (e.g. eager-load messages)
 
         Returns:
             Conversation: The requested conversation
@@ -74,48 +76,55 @@ class ConversationService:
             UnauthorizedAccessError: If conversation belongs to another user (403)
 
         Security:
-            MUST filter by user_id to prevent cross-user access.
+            MUST check user_id ownership to prevent cross-user access.
             Returns 403 (not 404) for other users' conversations to avoid info disclosure.
         """
-        # Query with user_id filter (CRITICAL for security)
-        statement = select(Conversation).where(
-            Conversation.id == conversation_id,
-            Conversation.user_id == self.user_id
-        )
-        conversation = self.db.exec(statement).first()
+        # Single primary-key lookup (identity map first), ownership checked in Python
+        conversation = self.db.get(Conversation, conversation_id, options=options)
 
         if not conversation:
-            # Check if conversation exists for another user (to return 403 instead of 404)
-            other_user_statement = select(Conversation).where(Conversation.id == conversation_id)
-            other_user_conversation = self.db.exec(other_user_statement).first()
-
-            if other_user_conversation:
-                # Conversation exists but belongs to another user - return 403
-                raise UnauthorizedAccessError(
-                    "Access denied: conversation belongs to another user"
-                )
-            else:
-                # Conversation doesn't exist at all - return 404
-                raise ConversationNotFoundError(conversation_id=str(conversation_id))
+            # Conversation doesn't exist at all - return 404
+            raise ConversationNotFoundError(conversation_id=str(conversation_id))
+
+        if conversation.user_id != str(self.user_id):
+            # Conversation exists but belongs to another user - return 403 (CRITICAL for security)
+            raise UnauthorizedAccessError(
+                "Access denied: conversation belongs to another user"
+            )
 
         return conversation
 
-    def list_conversations(self, limit: int = 50) -> List[Conversation]:
+    def list_conversations(
+        self,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Conversation]:
         """List all conversations for the authenticated user.
 
+        Keyset-paginated: pass the (updated_at, id) of the last conversation
+        of the previous page as `cursor` to get the next page. Each page is a
+        bounded range scan on the (user_id, updated_at, id) index, however
+        deep the page.
+
         Args:
             limit: Maximum number of conversations to return (default: 50)
+            cursor: (updated_at, id) to continue after (optional, first page if None)
 
         Returns:
-            List[Conversation]: List of conversations ordered by updated_at descending
+            List[Conversation]: List of conversations ordered by updated_at (then id) descending
 
         Note:
             Results are ALWAYS filtered by user_id (enforces user ownership).
         """
         # Query filtered by user_id (CRITICAL for security)
-        query = select(Conversation).where(
-            Conversation.user_id == self.user_id
-        ).order_by(Conversation.updated_at.desc()).limit(limit)
+        query = select(Conversation).where(Conversation.user_id == str(self.user_id))
+
+        if cursor is not None:
+            query = query.where(tuple_(Conversation.updated_at, Conversation.id) < cursor)
+
+        query = query.order_by(
+            Conversation.updated_at.desc(), Conversation.id.desc()
+        ).limit(limit)
 
         conversations = self.db.exec(query).all()
         return list(conversations)
@@ -142,30 +151,51 @@ class ConversationService:
             ConversationNotFoundError: If conversation doesn't exist for this user
             UnauthorizedAccessError: If conversation belongs to another user
         """
-        # Validate conversation ownership (will raise error if not found or unauthorized)
-        conversation = self.get_conversation(conversation_id)
+        # INSERT ... SELECT ... WHERE EXISTS: the ownership check happens inside
+        # the write, and RETURNING hands back the server timestamp (no refresh)
+        message_id = uuid4()
+        message_metadata = metadata or {}
+        columns = Message.__table__.c
+        owned = select(Conversation.id).where(
+            Conversation.id == conversation_id, Conversation.user_id == str(self.user_id)
+        )
+        row = self.db.exec(
+            insert(Message)
+            .from_select(
+                ["id", "conversation_id", "role", "content", "message_metadata"],
+                select(
+                    literal(message_id, columns.id.type),
+                    literal(conversation_id, columns.conversation_id.type),
+                    literal(role, columns.role.type),
+                    literal(content, columns.content.type),
+                    literal(message_metadata, columns.message_metadata.type),
+                ).where(exists(owned)),
+            )
+            .returning(Message.created_at)
+        ).first()
+        if row is None:
+            # Not found or not owned: raises the matching 404/403 error
+            self.get_conversation(conversation_id)
+            # The probe passed, so the conversation changed between the two
+            # statements (e.g. concurrently deleted); nothing was inserted
+            raise ConversationNotFoundError(str(conversation_id))
+
+        self.db.exec(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(updated_at=utcnow())
+        )
+        self.db.commit()
 
-        # Create message
-        message = Message(
+        return Message(
+            id=message_id,
             conversation_id=conversation_id,
             role=role,
             content=content,
-            message_metadata=metadata or {},
-            created_at=datetime.utcnow()
+            message_metadata=message_metadata,
+            created_at=row.created_at,
         )
 
-        # Persist to database
-        self.db.add(message)
-
-        # Update conversation's updated_at timestamp
-        conversation.updated_at = datetime.utcnow()
-        self.db.add(conversation)
-
-        self.db.commit()
-        self.db.refresh(message)
-
-        return message
-
     def get_messages(self, conversation_id: UUID) -> List[Message]:
         """Get all messages in a conversation.
 
@@ -181,17 +211,13 @@ class ConversationService:
 
         Note:
             Validates conversation ownership before retrieving messages.
+            The conversation and its messages are fetched in one round trip.
         """
         # Validate conversation ownership (will raise error if not found or unauthorized)
-        self.get_conversation(conversation_id)
-
-        # Query messages ordered by creation time
-        query = select(Message).where(
-            Message.conversation_id == conversation_id
-        ).order_by(Message.created_at.asc())
-
-        messages = self.db.exec(query).all()
-        return list(messages)
+        conversation = self.get_conversation(
+            conversation_id, options=[joinedload(Conversation.messages)]
+        )
+        return list(conversation.messages)
 
     def delete_conversation(self, conversation_id: UUID) -> None:
         """Delete a conversation and all its messages.
@@ -205,19 +231,14 @@ class ConversationService:
 
         Note:
             This is a hard delete (removes from database).
-            Messages are cascade deleted via foreign key constraint.
+            Messages are removed with one bulk DELETE (the foreign key also
+            cascades, but SQLite only enforces it with PRAGMA foreign_keys).
         """
         # Validate conversation ownership (will raise error if not found or unauthorized)
         conversation = self.get_conversation(conversation_id)
 
-        # Delete all messages in the conversation first
-        delete_messages_query = select(Message).where(Message.conversation_id == conversation_id)
-        messages = self.db.exec(delete_messages_query).all()
-        for message in messages:
-            self.db.delete(message)
-
-        # Flush message deletes before removing the conversation (foreign key constraint)
-        self.db.flush()
+        # Delete all messages in the conversation first (single statement, no ORM loading)
+        self.db.exec(delete(Message).where(Message.conversation_id == conversation_id))
 
         # Delete the conversation
         self.db.delete(conversation)
@@ -4,10 +4,12 @@ TaskService encapsulates all task-related business logic and database operations
 enforcing user ownership and data integrity rules.
 """
 from sqlmodel import Session, select
+from sqlalchemy import func, text, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from uuid import UUID
-from datetime import datetime
 from typing import List, Optional
-from src.models.task import Task, TaskStatus, TaskPriority
+from src.models.timestamps import utcnow
+from src.models.task import PRIORITY_RANK_SQL, Task, TaskStatus, TaskPriority
 from src.schemas.task_schemas import TaskCreate, TaskUpdate
 from src.utils.errors import TaskNotFoundError, UnauthorizedAccessError
 
@@ -55,9 +57,7 @@ class TaskService:
             description=data.description,
             status=data.status,
             priority=data.priority,
-            tags=data.tags,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            tags=data.tags
         )
 
         # Persist to database
@@ -101,8 +101,16 @@ class TaskService:
 
         # Apply tags filter (task must contain ALL specified tags)
         if tags:
-            for tag in tags:
-                query = query.where(Task.tags.contains([tag]))
+            if self.db.get_bind().dialect.name == "postgresql":
+                # Single JSONB containment predicate, served by the GIN index
+                query = query.where(type_coerce(Task.tags, JSONB).contains(tags))
+            else:
+                # SQLite: match each tag against the JSON array's elements
+                for tag in tags:
+                    elements = func.json_each(Task.tags).table_valued("value")
+                    query = query.where(
+                        select(1).select_from(elements).where(elements.c.value == tag).exists()
+                    )
 
         # Apply sorting
         if sort_by == "created_at":
@@ -110,13 +118,8 @@ class TaskService:
         elif sort_by == "updated_at":
             query = query.order_by(Task.updated_at.desc())
         elif sort_by == "priority":
-            # Sort by priority: high > medium > low
-            priority_order = {
-                TaskPriority.HIGH: 3,
-                TaskPriority.MEDIUM: 2,
-                TaskPriority.LOW: 1
-            }
-            query = query.order_by(Task.priority.desc())
+            # Sort by priority: high > medium > low (newest first within a level)
+            query = query.order_by(text(f"({PRIORITY_RANK_SQL}) DESC"), Task.created_at.desc())
         elif sort_by == "status":
             # Sort by status: todo > in-progress > completed
             query = query.order_by(Task.status)
@@ -142,29 +145,21 @@ class TaskService:
             UnauthorizedAccessError: If task belongs to another user (403)
 
         Security:
-            MUST filter by user_id to prevent cross-user access.
+            MUST check user_id ownership to prevent cross-user access.
             Returns 403 (not 404) for other users' tasks to avoid info disclosure.
         """
-        # Query with user_id filter (CRITICAL for security)
-        statement = select(Task).where(
-            Task.id == task_id,
-            Task.user_id == self.user_id
-        )
-        task = self.db.exec(statement).first()
+        # Single primary-key lookup (identity map first), ownership checked in Python
+        task = self.db.get(Task, task_id)
 
         if not task:
-            # Check if task exists for another user (to return 403 instead of 404)
-            other_user_statement = select(Task).where(Task.id == task_id)
-            other_user_task = self.db.exec(other_user_statement).first()
-
-            if other_user_task:
-                # Task exists but belongs to another user - return 403
-                raise UnauthorizedAccessError(
-                    "Access denied: task belongs to another user"
-                )
-            else:
-                # Task doesn't exist at all - return 404
-                raise TaskNotFoundError(task_id=str(task_id))
+            # Task doesn't exist at all - return 404
+            raise TaskNotFoundError(task_id=str(task_id))
+
+        if task.user_id != str(self.user_id):
+            # Task exists but belongs to another user - return 403 (CRITICAL for security)
+            raise UnauthorizedAccessError(
+                "Access denied: task belongs to another user"
+            )
 
         return task
 
@@ -196,8 +191,8 @@ class TaskService:
         for field, value in update_data.items():
             setattr(task, field, value)
 
-        # Update timestamp
-        task.updated_at = datetime.utcnow()
+        # Update timestamp (evaluated by the database, even if no field changed)
+        task.updated_at = utcnow()
 
         # Persist changes
         self.db.add(task)
@@ -0,0 +1,187 @@
+"""Minimal HS256 JWT encode/decode with a reusable HMAC key schedule.
+
+PyJWT builds a fresh HMAC object (key padding + two SHA-256 inits) and walks
+its generic algorithm/option machinery on every call. For the symmetric
+HS256 configuration we keep one keyed `hmac` template at module level and
+`copy()` it per token, serialize with orjson, and validate exactly the
+claims this app relies on.
+
+Only used when JWT_ALGORITHM is HS256; any other algorithm goes through
+PyJWT. Errors are raised as the corresponding PyJWT exception types, so
+callers catch the same `jwt.InvalidTokenError` hierarchy either way.
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import time
+from calendar import timegm
+from datetime import datetime
+from typing import Iterable, Optional
+
+import jwt
+import orjson
+
+# PyJWT emits the same header; precomputed so encode only serializes the payload
+_HEADER_SEGMENT = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+# Keyed HMAC templates, built once per secret (normally just one)
+_HMAC_TEMPLATES: dict[str, "hmac.HMAC"] = {}
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(segment: bytes) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError) as e:
+        raise jwt.DecodeError("Invalid token padding") from e
+
+
+def _sign(secret: str, signing_input: bytes) -> bytes:
+    """HMAC-SHA256 `signing_input` by copying the pre-keyed template for `secret`."""
+    template = _HMAC_TEMPLATES.get(secret)
+    if template is None:
+        template = _HMAC_TEMPLATES[secret] = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    h = template.copy()
+    h.update(signing_input)
+    return h.digest()
+
+
+def _timestamp(value):
+    return timegm(value.utctimetuple()) if isinstance(value, datetime) else value
+
+
+def encode(payload: dict, secret: str) -> str:
+    """Encode and sign a payload as an HS256 JWT.
+
+    Args:
+        payload: Claims; datetime `exp`/`iat`/`nbf` values become epoch seconds
+        secret: HMAC secret
+
+    Returns:
+        Compact JWS string
+    """
+    claims = dict(payload)
+    for claim in ("exp", "iat", "nbf"):
+        if claim in claims:
+            claims[claim] = _timestamp(claims[claim])
+    return sign(claims, secret)
+
+
+def sign(claims: dict, secret: str) -> str:
+    """Sign claims that are already JSON-ready (time claims as epoch ints).
+
+    Skips `encode`'s copy and datetime conversion for callers that build
+    the claims themselves.
+
+    Args:
+        claims: Claims to serialize as-is
+        secret: HMAC secret
+
+    Returns:
+        Compact JWS string
+    """
+    signing_input = _HEADER_SEGMENT + b"." + _b64encode(orjson.dumps(claims))
+    return (signing_input + b"." + _b64encode(_sign(secret, signing_input))).decode()
+
+
+def decode(
+    token: str,
+    secret: str,
+    issuer: str,
+    audience: str,
+    require: Iterable[str] = (),
+) -> dict:
+    """Verify an HS256 JWT and validate its registered claims.
+
+    Validates the signature, required claims, exp/iat/nbf, iss and aud with
+    the same semantics (and exception types) as `jwt.decode`.
+
+    Args:
+        token: Compact JWS string
+        secret: HMAC secret
+        issuer: Expected `iss`
+        audience: Expected `aud` (matched against a string or list claim)
+        require: Claims that must be present
+
+    Returns:
+        Decoded payload
+
+    Raises:
+        jwt.InvalidTokenError: Or the specific subclass PyJWT would raise
+    """
+    raw = token.encode()
+    try:
+        signing_input, signature = raw.rsplit(b".", 1)
+        header_segment, payload_segment = signing_input.split(b".", 1)
+    except ValueError as e:
+        raise jwt.DecodeError("Not enough segments") from e
+
+    if header_segment != _HEADER_SEGMENT:
+        try:
+            header = orjson.loads(_b64decode(header_segment))
+        except ValueError as e:
+            raise jwt.DecodeError("Invalid header string") from e
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    if not hmac.compare_digest(_sign(secret, signing_input), _b64decode(signature)):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64decode(payload_segment))
+    except ValueError as e:
+        raise jwt.DecodeError("Invalid payload string") from e
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    for claim in require:
+        if payload.get(claim) is None:
+            raise jwt.MissingRequiredClaimError(claim)
+
+    _validate_times(payload, time.time())
+
+    if "aud" not in payload:
+        raise jwt.MissingRequiredClaimError("aud")
+    aud = payload["aud"]
+    if isinstance(aud, str):
+        aud = [aud]
+    if not isinstance(aud, list) or not all(isinstance(a, str) for a in aud):
+        raise jwt.InvalidAudienceError("Invalid claim format in token")
+    if audience not in aud:
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+    if "iss" not in payload:
+        raise jwt.MissingRequiredClaimError("iss")
+    if payload["iss"] != issuer:
+        raise jwt.InvalidIssuerError("Invalid issuer")
+
+    return payload
+
+
+def _claim_int(payload: dict, claim: str, error: type, message: str) -> Optional[int]:
+    """Return an integer time claim, coerced the way PyJWT does (None if absent)."""
+    if claim not in payload:
+        return None
+    try:
+        return int(payload[claim])
+    except (ValueError, TypeError, OverflowError):
+        raise error(message) from None
+
+
+def _validate_times(payload: dict, now: float) -> None:
+    """Check iat / nbf / exp against `now` (no leeway, as configured for PyJWT)."""
+    iat = _claim_int(payload, "iat", jwt.InvalidIssuedAtError, "Issued At claim (iat) must be an integer.")
+    if iat is not None and iat > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+
+    nbf = _claim_int(payload, "nbf", jwt.DecodeError, "Not Before claim (nbf) must be an integer.")
+    if nbf is not None and nbf > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    exp = _claim_int(payload, "exp", jwt.DecodeError, "Expiration Time claim (exp) must be an integer.")
+    if exp is not None and exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
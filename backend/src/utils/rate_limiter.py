@@ -1,21 +1,57 @@
 """Rate limiting utilities for authentication endpoints."""
+import logging
+import math
 import threading
-from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Dict, List
+import time
+from datetime import timedelta
+from typing import List, Tuple
+from cachetools import TTLCache
+from src.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Atomic check-and-increment: one round trip, no window between the check and
+# the counter bump. Fixed window starting at the first attempt.
+# KEYS[1] = counter key, ARGV[1] = window seconds, ARGV[2] = max attempts
+# Returns {allowed (1/0), seconds until the window resets}
+_CHECK_AND_RECORD_LUA = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+local allowed = 0
+if n <= tonumber(ARGV[2]) then allowed = 1 end
+return {allowed, redis.call('TTL', KEYS[1])}
+"""
+
+# Independent lock + bucket map shards; unrelated emails never contend
+_STRIPES = 32
+
+# Upper bound on tracked emails across all stripes (attackers cycling through
+# addresses cannot grow the map without limit)
+_MAX_TRACKED_EMAILS = 100_000
 
 
 class LoginRateLimiter:
     """In-memory rate limiter for login attempts.
 
-    Implements a sliding window algorithm to track login attempts per email.
-    Thread-safe for concurrent requests.
+    Implements a token bucket per email: each bucket holds up to
+    `max_attempts` tokens and refills at `max_attempts` per window, so the
+    steady-state limit matches the window while only two floats are stored
+    per email (no per-attempt timestamp list to append to or prune).
+    Thread-safe for concurrent requests: buckets are sharded across
+    `_STRIPES` lock-protected maps by hash(email), so only logins for emails
+    in the same stripe serialize. Each stripe is a TTLCache: a bucket untouched
+    for longer than the window has refilled completely and is simply dropped,
+    and the LRU cap bounds memory.
+
+    `check_and_record` / `reset` are the login entry points: when REDIS_URL is
+    configured they use a shared Redis counter (atomic Lua script, limits hold
+    across workers), otherwise - or if Redis errors - the in-memory buckets.
 
     Attributes:
-        max_attempts: Maximum allowed attempts within window
-        window: Time window for rate limiting
-        attempts: Dictionary mapping email -> list of attempt timestamps
-        lock: Thread lock for concurrent access
+        max_attempts: Bucket capacity (maximum burst of attempts)
+        window: Time to refill an empty bucket completely
+        window_seconds: Same window as integer seconds (precomputed)
+        stripes: (lock, TTLCache{email: (tokens, last_refill monotonic ts)}) shards
     """
 
     def __init__(self, max_attempts: int = 5, window_minutes: int = 15):
@@ -27,58 +63,80 @@ class LoginRateLimiter:
         """
         self.max_attempts = max_attempts
         self.window = timedelta(minutes=window_minutes)
-        self.attempts: Dict[str, List[datetime]] = defaultdict(list)
-        self.lock = threading.Lock()
-
-    def is_allowed(self, email: str) -> bool:
-        """Check if a login attempt is allowed for the given email.
+        self.window_seconds = window_minutes * 60
+        self.refill_rate = max_attempts / self.window_seconds
+        self.stripes: List[Tuple[threading.Lock, TTLCache]] = [
+            (
+                threading.Lock(),
+                TTLCache(maxsize=_MAX_TRACKED_EMAILS // _STRIPES, ttl=self.window_seconds + 60),
+            )
+            for _ in range(_STRIPES)
+        ]
+        self._script = None
+
+    def _stripe(self, email: str) -> Tuple[threading.Lock, TTLCache]:
+        """Return the (lock, buckets) shard owning an email."""
+        return self.stripes[hash(email) % _STRIPES]
+
+    def _tokens(self, buckets: TTLCache, email: str, now: float) -> float:
+        """Return the refilled token count for an email (caller holds the stripe lock)."""
+        bucket = buckets.get(email)
+        if bucket is None:
+            return float(self.max_attempts)
+        tokens, last = bucket
+        return min(self.max_attempts, tokens + (now - last) * self.refill_rate)
+
+    def _seconds_until_token(self, tokens: float) -> int:
+        """Seconds until a bucket holding `tokens` has one whole token again."""
+        if tokens >= 1:
+            return 0
+        return math.ceil((1 - tokens) / self.refill_rate)
+
+    async def check_and_record(self, email: str) -> Tuple[bool, int]:
+        """Check the limit and count this attempt in a single step.
 
         Args:
-            email: Email address to check
+            email: Email address attempting to log in
 
         Returns:
-            True if attempt is allowed, False if rate limited
-        """
-        now = datetime.utcnow()
-        cutoff = now - self.window
-
-        with self.lock:
-            # Remove old attempts outside the window
-            self.attempts[email] = [
-                attempt_time for attempt_time in self.attempts[email]
-                if attempt_time > cutoff
-            ]
-
-            # Check if under limit
-            return len(self.attempts[email]) < self.max_attempts
-
-    def record_attempt(self, email: str) -> None:
-        """Record a login attempt for the given email.
-
-        Args:
-            email: Email address to record
+            Tuple of (allowed, retry_after_seconds); retry_after is only
+            meaningful when not allowed
         """
-        now = datetime.utcnow()
-        with self.lock:
-            self.attempts[email].append(now)
-
-    def get_retry_after(self, email: str) -> int:
-        """Get seconds until oldest attempt expires (rate limit resets).
+        client = get_redis_client()
+        if client is not None:
+            try:
+                if self._script is None:
+                    self._script = client.register_script(_CHECK_AND_RECORD_LUA)
+                allowed, ttl = await self._script(
+                    keys=[f"rl:login:{email}"],
+                    args=[self.window_seconds, self.max_attempts],
+                )
+                return bool(allowed), max(0, int(ttl))
+            except Exception as e:
+                logger.warning("Redis rate limiter unavailable, using in-memory: %s", e)
+
+        now = time.monotonic()
+        lock, buckets = self._stripe(email)
+        with lock:
+            tokens = self._tokens(buckets, email, now)
+            if tokens >= 1:
+                buckets[email] = (tokens - 1, now)
+                return True, 0
+            return False, self._seconds_until_token(tokens)
+
+    async def reset(self, email: str) -> None:
+        """Reset the counter for an email (e.g., on successful login).
 
         Args:
-            email: Email address to check
-
-        Returns:
-            Seconds until rate limit resets (0 if no limit)
+            email: Email address to reset
         """
-        with self.lock:
-            if not self.attempts[email]:
-                return 0
-
-            oldest = min(self.attempts[email])
-            retry_at = oldest + self.window
-            seconds = int((retry_at - datetime.utcnow()).total_seconds())
-            return max(0, seconds)
+        client = get_redis_client()
+        if client is not None:
+            try:
+                await client.delete(f"rl:login:{email}")
+            except Exception as e:
+                logger.warning("Redis rate limiter reset failed: %s", e)
+        self.clear_attempts(email)
 
     def clear_attempts(self, email: str) -> None:
         """Clear all attempts for an email (e.g., on successful login).
@@ -86,9 +144,9 @@ class LoginRateLimiter:
         Args:
             email: Email address to clear
         """
-        with self.lock:
-            if email in self.attempts:
-                del self.attempts[email]
+        lock, buckets = self._stripe(email)
+        with lock:
+            buckets.pop(email, None)
 
 
 # Global rate limiter instance
@@ -0,0 +1,19 @@
+"""Shared async Redis client for optional Redis-backed features.
+
+Disabled unless REDIS_URL is configured; callers treat a None client (or any
+Redis error) as "no Redis" and fall back to their in-process/database path.
+"""
+from src.config import settings
+
+_client = None
+
+
+def get_redis_client():
+    """Return the shared async Redis client, or None when Redis is not configured."""
+    global _client
+    if not settings.redis_url:
+        return None
+    if _client is None:
+        import redis.asyncio as redis
+        _client = redis.from_url(settings.redis_url, decode_responses=True)
+    return _client
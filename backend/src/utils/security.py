@@ -1,41 +1,124 @@
 """Security utilities for password hashing and JWT token management.
 
 Security best practices implemented:
-- Bcrypt password hashing with configurable work factor
+- Argon2id password hashing (legacy bcrypt hashes upgraded on login)
+- Optional server-side pepper (HMAC-SHA256 pre-hash) for new password hashes
 - JWT tokens with iss/aud/type claims
-- Constant-time comparison for token verification
+- Refresh tokens looked up by indexed SHA-256 hash (no per-row comparison)
 - Secure refresh token generation with SHA-256 hashing
 """
 import re
 import hashlib
-import secrets
-from datetime import datetime, timedelta, timezone
+import hmac
+import base64
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
 from typing import Optional, Tuple
-from passlib.context import CryptContext
+from cachetools import TTLCache
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
 import jwt
 from src.config import settings
+from src.utils import jwt_hs256
+
+logger = logging.getLogger(__name__)
+
+# Settings read on every token issue/verify, bound once at import
+_JWT_SECRET = settings.jwt_secret
+_JWT_ISSUER = settings.jwt_issuer
+_JWT_AUDIENCE = settings.jwt_audience
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_HS256 = _JWT_ALGORITHM == "HS256"
+_ACCESS_EXPIRE_SECONDS = settings.jwt_access_expire_minutes * 60
+# Encoded once; empty means no pepper
+_PASSWORD_PEPPER = settings.password_pepper.encode()
+
+# Refresh tokens are 256-bit random values, so a single SHA-256 is enough to
+# store them safely. CPython's OpenSSL-backed sha256 uses SHA-NI/ARMv8 crypto
+# extensions where available (dispatch is decided by OpenSSL at runtime); log
+# the backend, and warn if we were built against the slower built-in fallback.
+if hashlib.sha256.__module__ != "_hashlib":
+    logger.warning(
+        "hashlib.sha256 is not OpenSSL-backed; refresh token hashing will use "
+        "the software fallback"
+    )
+else:
+    import ssl
+
+    logger.debug("Refresh token hashing uses %s sha256", ssl.OPENSSL_VERSION)
+
+# Bound once: refresh and login hash on every call
+_sha256 = hashlib.sha256
+_b64encode = base64.urlsafe_b64encode
+
+
+# Decoded JWT payloads keyed on the SHA-256 digest of the raw token (never the
+# token itself), so repeat requests with the same bearer skip base64 + HMAC +
+# JSON + claim checks. exp is still checked on every hit.
+_VERIFIED_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_VERIFIED_TOKEN_CACHE_LOCK = threading.Lock()
+
+_REQUIRED_CLAIMS = ("exp", "iat", "sub", "iss", "aud", "type")
 
 
-# Password hashing context using bcrypt
-# Work factor (rounds) is configurable via BCRYPT_ROUNDS env var
-# Default: 12 for production security, use 4 for development speed
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=settings.bcrypt_rounds
+# Compiled once at import instead of going through re's pattern cache per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Character classes for validate_password (same sets as the original regexes:
+# ASCII [a-z] / [A-Z], Unicode \d, and the listed specials)
+_LOWER = frozenset("abcdefghijklmnopqrstuvwxyz")
+_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_DIGITS = frozenset("0123456789")
+_SPECIAL = frozenset("!@#$%^&*(),.?\":{}|<>_-+=[]\\;'`~")
+
+
+# Password hashing: argon2-cffi for argon2id, the bcrypt C module only to
+# verify (and then upgrade) hashes created before the switch. Called directly -
+# no passlib scheme detection / option parsing per call.
+# Cost parameters are configurable via ARGON2_* env vars
+_ARGON2 = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism,
+    type=Type.ID,
 )
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Short-lived verify results for retried logins (CACHE_PASSWORD_VERIFICATIONS).
+# Keys are HMACs under a per-process random key, so cached entries cannot be
+# used to brute-force passwords at hash speed; only outcomes that need no
+# hash upgrade are cached.
+_VERIFY_CACHE_ENABLED = settings.cache_password_verifications
+_VERIFY_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=5)
+_VERIFY_CACHE_LOCK = threading.Lock()
+_VERIFY_CACHE_KEY = os.urandom(32)
+
+
+def _peppered(password: str) -> str:
+    """Pre-hash a password with the server-side pepper (no-op if none configured).
+
+    Only applied to argon2 hashes; legacy bcrypt hashes were made from the
+    raw password.
+    """
+    if not _PASSWORD_PEPPER:
+        return password
+    return hmac.new(_PASSWORD_PEPPER, password.encode(), hashlib.sha256).hexdigest()
 
 
 def hash_password(password: str) -> str:
-    """Hash a plain password using bcrypt.
+    """Hash a plain password using argon2id.
 
     Args:
         password: Plain text password
 
     Returns:
-        Bcrypt-hashed password with salt
+        Argon2id hash (salt and parameters encoded in the string)
     """
-    return pwd_context.hash(password)
+    return _ARGON2.hash(_peppered(password))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -43,12 +126,68 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Args:
         plain_password: Plain text password from user input
-        hashed_password: Stored bcrypt hash
+        hashed_password: Stored argon2id or legacy bcrypt hash
 
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_and_upgrade_password(plain_password, hashed_password)[0]
+
+
+def verify_and_upgrade_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash when the stored one is outdated.
+
+    Legacy bcrypt hashes (and argon2 hashes with old cost parameters) are
+    re-hashed with the current argon2id settings after a successful verify.
+    With CACHE_PASSWORD_VERIFICATIONS enabled, a repeat of the same
+    (password, hash) pair within 5s reuses the previous result.
+
+    Args:
+        plain_password: Plain text password from user input
+        hashed_password: Stored argon2id or legacy bcrypt hash
+
+    Returns:
+        Tuple of (is_valid, new_hash); new_hash is None unless the caller
+        should store an upgraded hash
+    """
+    if not _VERIFY_CACHE_ENABLED:
+        return _verify_and_upgrade(plain_password, hashed_password)
+
+    key = hmac.new(
+        _VERIFY_CACHE_KEY,
+        plain_password.encode() + b"\0" + hashed_password.encode(),
+        hashlib.sha256,
+    ).digest()
+    with _VERIFY_CACHE_LOCK:
+        cached = _VERIFY_CACHE.get(key)
+    if cached is not None:
+        return cached, None
+
+    valid, new_hash = _verify_and_upgrade(plain_password, hashed_password)
+    if new_hash is None:
+        with _VERIFY_CACHE_LOCK:
+            _VERIFY_CACHE[key] = valid
+    return valid, new_hash
+
+
+def _verify_and_upgrade(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Uncached verify for verify_and_upgrade_password."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            valid = bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        except ValueError:  # malformed hash
+            return False, None
+        return (True, hash_password(plain_password)) if valid else (False, None)
+
+    try:
+        _ARGON2.verify(hashed_password, _peppered(plain_password))
+    except (VerificationError, InvalidHashError):
+        return False, None
+    if _ARGON2.check_needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
 
 
 def validate_email(email: str) -> bool:
@@ -60,8 +199,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def normalize_email(email: str) -> str:
@@ -95,16 +233,28 @@ def validate_password(password: str) -> Tuple[bool, Optional[str]]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters"
 
-    if not re.search(r'[a-z]', password):
+    # Class checks run as C-level set operations over the distinct characters
+    # (cheaper than a per-character Python loop, and than bytes.translate
+    # tables, on typical passwords); non-ASCII digits keep the Unicode \d rule
+    chars = set(password)
+    has_lower = not chars.isdisjoint(_LOWER)
+    has_upper = not chars.isdisjoint(_UPPER)
+    if password.isascii():
+        has_digit = not chars.isdisjoint(_DIGITS)
+    else:
+        has_digit = any(ch.isdecimal() for ch in chars)
+    has_special = not chars.isdisjoint(_SPECIAL)
+
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
 
-    if not re.search(r'[A-Z]', password):
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
 
-    if not re.search(r'\d', password):
+    if not has_digit:
         return False, "Password must contain at least one digit"
 
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>_\-+=\[\]\\;\'`~]', password):
+    if not has_special:
         return False, "Password must contain at least one special character"
 
     return True, None
@@ -128,28 +278,35 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         Encoded JWT access token
     """
-    now = datetime.now(timezone.utc)
-    to_encode = data.copy()
-
+    # Integer epoch seconds (what the claims encode to anyway): one clock read
+    # and no datetime construction / conversion
+    now = int(time.time())
     if expires_delta:
-        expire = now + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = now + timedelta(minutes=settings.jwt_access_expire_minutes)
+        expire = now + _ACCESS_EXPIRE_SECONDS
 
-    to_encode.update({
-        "iss": settings.jwt_issuer,
-        "aud": settings.jwt_audience,
+    to_encode = {
+        **data,
+        "iss": _JWT_ISSUER,
+        "aud": _JWT_AUDIENCE,
         "exp": expire,
         "iat": now,
         "type": "access",
-    })
+    }
 
-    return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    if _JWT_HS256:
+        # Claims are built JSON-ready above, so sign them without re-conversion
+        return jwt_hs256.sign(to_encode, _JWT_SECRET)
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
 def verify_token(token: str, expected_type: str = "access") -> dict:
     """Verify and decode a JWT token with full claim validation.
 
+    HS256 (the default) is handled by the in-house jwt_hs256 fast path;
+    other algorithms go through PyJWT.
+
     Validates:
     - Signature using HS256 and JWT_SECRET
     - Expiration (exp claim)
@@ -157,6 +314,9 @@ def verify_token(token: str, expected_type: str = "access") -> dict:
     - Audience (aud claim)
     - Token type (access vs refresh)
 
+    Payloads that passed are cached for up to 60s by token digest; a hit
+    only re-checks type and expiry.
+
     Args:
         token: JWT token to verify
         expected_type: Expected token type ("access" or "refresh")
@@ -170,14 +330,31 @@ def verify_token(token: str, expected_type: str = "access") -> dict:
         jwt.InvalidIssuerError: If issuer doesn't match
         jwt.InvalidAudienceError: If audience doesn't match
     """
-    payload = jwt.decode(
-        token,
-        settings.jwt_secret,
-        algorithms=[settings.jwt_algorithm],
-        issuer=settings.jwt_issuer,
-        audience=settings.jwt_audience,
-        options={"require": ["exp", "iat", "sub", "iss", "aud", "type"]}
-    )
+    digest = _sha256(token.encode()).digest()
+    with _VERIFIED_TOKEN_CACHE_LOCK:
+        cached = _VERIFIED_TOKEN_CACHE.get(digest)
+    if cached is not None and cached.get("type") == expected_type:
+        if cached["exp"] > time.time():
+            return dict(cached)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    if _JWT_HS256:
+        payload = jwt_hs256.decode(
+            token,
+            _JWT_SECRET,
+            issuer=_JWT_ISSUER,
+            audience=_JWT_AUDIENCE,
+            require=_REQUIRED_CLAIMS,
+        )
+    else:
+        payload = jwt.decode(
+            token,
+            _JWT_SECRET,
+            algorithms=[_JWT_ALGORITHM],
+            issuer=_JWT_ISSUER,
+            audience=_JWT_AUDIENCE,
+            options={"require": list(_REQUIRED_CLAIMS)}
+        )
 
     # Validate token type
     token_type = payload.get("type")
@@ -186,6 +363,8 @@ def verify_token(token: str, expected_type: str = "access") -> dict:
             f"Invalid token type: expected {expected_type}, got {token_type}"
         )
 
+    with _VERIFIED_TOKEN_CACHE_LOCK:
+        _VERIFIED_TOKEN_CACHE[digest] = dict(payload)
     return payload
 
 
@@ -195,11 +374,15 @@ def generate_refresh_token() -> Tuple[str, str]:
     Returns:
         Tuple of (raw_token, hashed_token)
         - raw_token: URL-safe random string (give to client)
-        - hashed_token: SHA-256 hash (store in database)
+        - hashed_token: SHA-256 hash (store in database); same digest
+          hash_refresh_token() computes at lookup time
     """
-    raw_token = secrets.token_urlsafe(32)
-    hashed_token = hashlib.sha256(raw_token.encode()).hexdigest()
-    return raw_token, hashed_token
+    # Same as secrets.token_urlsafe(32), inlined so the ASCII bytes are hashed
+    # directly (no decode/encode round trip). The digest must stay over the
+    # token string the client sends back, not the 32 random bytes, or
+    # hash_refresh_token() lookups of existing tokens would stop matching.
+    raw = _b64encode(os.urandom(32)).rstrip(b"=")
+    return raw.decode("ascii"), _sha256(raw).hexdigest()
 
 
 def hash_refresh_token(raw_token: str) -> str:
@@ -214,20 +397,5 @@ def hash_refresh_token(raw_token: str) -> str:
     Returns:
         SHA-256 hex digest of the token
     """
-    return hashlib.sha256(raw_token.encode()).hexdigest()
-
-
-def verify_refresh_token_hash(raw_token: str, stored_hash: str) -> bool:
-    """Verify a refresh token against its stored hash.
-
-    Uses constant-time comparison to prevent timing attacks.
+    return _sha256(raw_token.encode()).hexdigest()
 
-    Args:
-        raw_token: Raw refresh token from client
-        stored_hash: SHA-256 hash stored in database
-
-    Returns:
-        True if token matches hash, False otherwise
-    """
-    computed_hash = hash_refresh_token(raw_token)
-    return secrets.compare_digest(computed_hash, stored_hash)
@@ -0,0 +1,83 @@
+"""Redis mirror of active refresh tokens for fast refresh lookups.
+
+SQL remains the durable source of truth: Redis only lets the refresh path
+skip the `SELECT ... WHERE token_hash = ?` probe. Each active token is stored
+as `rt:<token_hash> -> "<user_id>|<expires_ts>"` with EXPIREAT at the token's
+expiry, and every user has a `rtu:<user_id>` set of their hashes so logout can
+evict them.
+
+Disabled unless REDIS_URL is configured. Redis errors are logged and treated
+as cache misses, so an outage degrades to the SQL path instead of failing auth.
+"""
+import logging
+from typing import Optional, Tuple
+from uuid import UUID
+from src.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+async def cache_refresh_token(token_hash: str, user_id: UUID, expires_ts: int) -> None:
+    """Mirror a newly issued refresh token into Redis.
+
+    Args:
+        token_hash: SHA-256 hash of the raw refresh token
+        user_id: Owner of the token
+        expires_ts: Token expiry as epoch seconds (the key expires at the same instant)
+    """
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.set(f"rt:{token_hash}", f"{user_id}|{expires_ts}", exat=expires_ts)
+            pipe.sadd(f"rtu:{user_id}", token_hash)
+            # Newest token always expires last, so the set lives as long as it
+            pipe.expireat(f"rtu:{user_id}", expires_ts)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Refresh token cache write failed: %s", e)
+
+
+async def consume_refresh_token(token_hash: str) -> Optional[Tuple[UUID, float]]:
+    """Atomically fetch and delete a mirrored refresh token (rotation consumes it).
+
+    Args:
+        token_hash: SHA-256 hash of the raw refresh token
+
+    Returns:
+        (user_id, expires_ts) on a hit, None on a miss or when Redis is unavailable
+    """
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        value = await client.getdel(f"rt:{token_hash}")
+    except Exception as e:
+        logger.warning("Refresh token cache read failed: %s", e)
+        return None
+    if value is None:
+        return None
+    user_id, expires_ts = value.split("|", 1)
+    try:
+        await client.srem(f"rtu:{user_id}", token_hash)
+    except Exception as e:
+        logger.warning("Refresh token cache cleanup failed: %s", e)
+    return UUID(user_id), float(expires_ts)
+
+
+async def evict_user_refresh_tokens(user_id: UUID) -> None:
+    """Drop all mirrored refresh tokens for a user (logout / revocation).
+
+    Args:
+        user_id: User whose tokens were revoked in SQL
+    """
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        hashes = await client.smembers(f"rtu:{user_id}")
+        keys = [f"rt:{h}" for h in hashes] + [f"rtu:{user_id}"]
+        await client.delete(*keys)
+    except Exception as e:
+        logger.warning("Refresh token cache eviction failed: %s", e)